@@ -1,9 +1,16 @@
 # Libraries
 from abc import ABC, abstractmethod
+from itertools import chain
 from random import randint
 from typing import List, Tuple
 
-from pygame import math as pmath, Rect, Surface, sprite, transform # To distinguish it from ye olde math
+import numpy as np
+from pygame import math as pmath, Rect, SRCALPHA, Surface, sprite, transform # To distinguish it from ye olde math
+
+try:
+    from numba import njit, prange
+except ImportError: # Particles are then integrated with plain NumPy.
+    njit = None
 
 # TODO:
 # Particle:
@@ -16,6 +23,43 @@ from pygame import math as pmath, Rect, Surface, sprite, transform # To distingu
 # - Move to an actual logger.
 
 # Code
+class _SlotVector(pmath.Vector2):
+    """Vector2 returned for state that lives in a ParticleSystem's array, e.g. 
+    the position of a bound Particle. Changing it in place writes the new value 
+    back through the attribute it was read from, so `p.position.x += 1` works 
+    the same whether or not p is bound. Vectors computed from it (v + w, 
+    v.copy(), ...) are plain copies."""
+
+    __slots__ = ('_owner', '_attr')
+
+    @classmethod
+    def of(cls, owner, attr: str, value) -> "_SlotVector":
+        vector = cls(value.tolist())
+        pmath.Vector2.__setattr__(vector, '_owner', owner)
+        pmath.Vector2.__setattr__(vector, '_attr', attr)
+        return vector
+
+    def _write_back(self):
+        owner = getattr(self, '_owner', None)
+        if owner is not None:
+            setattr(owner, self._attr, tuple(self))
+
+def _writing_back(name: str):
+    method = getattr(pmath.Vector2, name)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._write_back()
+        return result
+    return wrapper
+
+# Everything that changes a Vector2 in place, x, y and swizzles included.
+for _name in ('__setattr__', '__setitem__', '__iadd__', '__isub__', '__imul__', 
+    '__itruediv__', '__ifloordiv__', 'update', 'scale_to_length', 'from_polar', 
+    'normalize_ip', 'reflect_ip', 'rotate_ip', 'rotate_ip_rad', 'rotate_rad_ip', 
+    'clamp_magnitude_ip', 'move_towards_ip'):
+    setattr(_SlotVector, _name, _writing_back(_name))
+del _name
+
 class GameObject(sprite.Sprite):
     """GameObjects for Pygannuum.
 
@@ -33,13 +77,19 @@ class GameObject(sprite.Sprite):
         None.
     """
 
-    def __init__(self, texture: Surface, 
+    # pygame's Sprite has no __slots__, so instances still get a __dict__. The 
+    # slots keep the attributes used every frame out of it.
+    __slots__ = ('_image', '_xform_cache', '_xform_key', '_position', '_scale', 
+        '_rotation', '_renderer', '_render_fn', '_updater', '_update_fn', 'rect')
+
+    def __init__(self, texture: Surface=None, 
         position: pmath.Vector2 | Tuple[float, float]=(0.0, 0.0), 
         scale:pmath.Vector2 | Tuple[float, float]=(10, 10), rotation: float=0.0, 
         renderer: "GORenderer"=None, updater: "GOUpdater"=None):
         sprite.Sprite.__init__(self)
 
-        self.image = texture
+        # GameObjects without a texture all share the same one.
+        self.image = DEFAULT_TEXTURE if texture is None else texture
         self.position = position
         self.scale = scale
         self.rotation = rotation
@@ -49,6 +99,10 @@ class GameObject(sprite.Sprite):
         # By default, hitboxes are rects. Good for performance, bad for pixel accuracy.
         self.rect = self.renderer.hitbox(self)
 
+    @property
+    def image(self) -> Surface:
+        return self._image
+
     @property
     def position(self) -> pmath.Vector2:
         return self._position
@@ -59,12 +113,21 @@ class GameObject(sprite.Sprite):
 
     @property
     def rotation(self) -> float:
-        return self._rotation
+        return self._rotation % 360
 
     @property
     def renderer(self) -> "GORenderer":
         return self._renderer
 
+    @property
+    def updater(self) -> "GOUpdater":
+        return self._updater
+
+    @image.setter
+    def image(self, i: Surface):
+        self._image = i
+        self.invalidate_texture()
+
     @position.setter
     def position(self, p: pmath.Vector2 | Tuple[float, float]):
         self._position = pmath.Vector2(p)   # Just make sure everything is converted.
@@ -75,12 +138,33 @@ class GameObject(sprite.Sprite):
 
     @rotation.setter
     def rotation(self, r: float):
-        self._rotation = r % 360
+        # Stored as given, it's only wrapped to [0, 360) when read. Renderers 
+        # read _rotation and wrap the angle they actually use.
+        self._rotation = r
 
     @renderer.setter
     def renderer(self, r: "GORenderer"):
         # Ensure that the GameObject always has a renderer present.
         self._renderer = DEFAULT_RENDERER if r is None else r
+        # Plain BasicRenderers are skipped, draw() calls basic_render directly.
+        self._render_fn = (basic_render if type(self._renderer) is BasicRenderer 
+            else self._renderer)
+
+    @updater.setter
+    def updater(self, u: "GOUpdater"):
+        self._updater = u
+        # Plain BasicParticleUpdaters are skipped, update() calls 
+        # basic_particle_update directly.
+        self._update_fn = (basic_particle_update 
+            if type(u) is BasicParticleUpdater else None)
+
+    def invalidate_texture(self):
+        """Drops the transformed texture cached by the renderer, so that it is 
+        rebuilt on next use. Call it after drawing onto the image in place, 
+        assigning image does it already."""
+
+        self._xform_cache = None
+        self._xform_key = None
 
     def update(self, dt: float):
         """Updates the state of the GameObject. 
@@ -88,15 +172,15 @@ class GameObject(sprite.Sprite):
         Args:
             dt (float): Delta-time. Allows for framerate independence.
         """
-        try:
-            self.updater(dt)
-        except TypeError:
-            pass
+        if self._update_fn is not None:
+            self._update_fn(self._updater, dt)
+        elif self._updater is not None:
+            self._updater(dt)
 
     def draw(self, surface: Surface, area=None, special_flags=0):
         """Draws the texture onto a surface."""
 
-        self.renderer(self, surface, area=None, special_flags=0)
+        self._render_fn(self, surface, area, special_flags)
 
 class GORenderer(ABC):
     """Base class for GameObject renderers. GameObjects are drawn with their
@@ -116,11 +200,140 @@ class GORenderer(ABC):
         """Returns the hitbox of the GameObject based on its texture."""
         pass
 
+def _centred_rect(texture: Surface, gameobject: GameObject) -> Rect:
+    """Returns the rect of a texture centred on the rounded position of a 
+    GameObject, which is both where it is drawn and its hitbox. Reads position 
+    rather than _position, as a Particle's may live in its ParticleSystem."""
+
+    position = gameobject.position
+    return texture.get_rect(center=(round(position.x), round(position.y)))
+
+def _blit_centred(texture: Surface, gameobject: GameObject, surface: Surface, 
+    area=None, special_flags=0):
+    """Blits the prepared texture of a GameObject around its centre."""
+
+    rect = _centred_rect(texture, gameobject)
+
+    # Check if the GameObject is within the display. If not, don't draw. 
+    if not surface.get_rect().colliderect(rect):
+        return
+
+    surface.blit(texture, rect.topleft, area=area, 
+        special_flags=special_flags)
+
 class BasicRenderer(GORenderer):
-    """Basic renderer for GameObjects."""
+    """Basic renderer for GameObjects.
+
+    The scaled and rotated texture is cached on the GameObject and only rebuilt
+    when its image, rounded scale or rotation changes. Rotation is snapped to
+    the nearest degree so that smooth motion still hits the cache. Edits made 
+    to the image in place are not noticed: call 
+    GameObject.invalidate_texture() after them (at native size and 0° the image 
+    is drawn as is, but don't rely on that).
+
+    Args:
+        smooth (bool): Whether uniformly scaled, rotated textures are made with 
+        pygame.transform.rotozoom(), which does it in one pass. Its output is 
+        antialiased and usually a pixel larger than that of rotate(scale()), 
+        so turn it off for pixel art or when exact sizes and hitboxes matter. 
+        Defaults to True.
+    """
     
-    def __init__(self):
-        pass
+    def __init__(self, smooth: bool=True):
+        self.smooth = smooth
+
+    def _prepare(self, gameobject: GameObject) -> Surface:
+        """Returns the scaled and rotated texture of the GameObject."""
+
+        rotation = round(gameobject._rotation) % 360 # 1° snap.
+        size = (round(gameobject.scale.x), round(gameobject.scale.y))
+        key = (id(gameobject.image), size, rotation, self.smooth)
+        if gameobject._xform_key != key:
+            width, height = gameobject.image.get_size()
+            zoom_x, zoom_y = size[0] / width, size[1] / height
+            if rotation == 0:
+                # Nothing to rotate, and nothing at all to do at native size.
+                texture = (gameobject.image if size == (width, height) 
+                    else transform.scale(gameobject.image, size))
+            elif self.smooth and zoom_x == zoom_y:
+                # Uniform scale: let rotozoom scale and rotate in one pass.
+                texture = transform.rotozoom(gameobject.image, rotation, zoom_x)
+            else:
+                texture = transform.rotate(
+                    transform.scale(gameobject.image, size), rotation)
+            gameobject._xform_cache = texture
+            gameobject._xform_key = key
+        return gameobject._xform_cache
+
+    def __call__(self, gameobject: GameObject, surface: Surface, area=None, 
+        special_flags=0):
+        """Draw the GameObject. See basic_render()."""
+
+        basic_render(gameobject, surface, area, special_flags)
+
+    def hitbox(self, gameobject: GameObject) -> Rect:
+        return _centred_rect(self._prepare(gameobject), gameobject)
+
+def basic_render(gameobject: GameObject, surface: Surface, area=None, 
+    special_flags=0):
+    """Draws a GameObject the way a BasicRenderer does. GameObjects with a 
+    BasicRenderer call this directly, skipping the renderer's __call__.
+
+    Args:
+        gameobject (GameObject): The GameObject to draw.
+        surface (pygame.Surface): Surface the GameObject is drawn on.
+        area: Same as pygame.Surface.blit(). Defaults to None.
+        special_flags: Same as pygame.Surface.blit(). Defaults to 0.
+    """
+    
+    # Scale the GameObject texture and rotate it around its position. Custom 
+    # renderers may call this too, they get the default settings.
+    renderer = gameobject._renderer
+    if not isinstance(renderer, BasicRenderer):
+        renderer = DEFAULT_RENDERER
+    _blit_centred(renderer._prepare(gameobject), gameobject, surface, area, 
+        special_flags)
+
+class RotationLUTRenderer(GORenderer):
+    """Renderer that looks textures up in a table of pre-rotated frames instead 
+    of rotating them whenever the rotation changes. The frames are built once 
+    per image and size, on first use or with preload(), and are shared by all 
+    GameObjects using the renderer. Rotation is snapped to the nearest frame. 
+    Edits made to an image in place are not noticed: clear frames, or drop the 
+    image's entries from it, after them.
+
+    Args:
+        bins (int): Number of frames in a full turn. Each image and size costs 
+        about bins times its scaled size in memory. Defaults to 36.
+    """
+
+    def __init__(self, bins: int=36):
+        self.bins = bins
+        self.frames = {} # (image, size): pre-rotated Surfaces.
+
+    def preload(self, image: Surface, 
+        scale: pmath.Vector2 | Tuple[float, float]) -> List[Surface]:
+        """Builds the frames of an image at a scale ahead of time, e.g. while 
+        loading, and returns them."""
+
+        return self._frames(image, (round(scale[0]), round(scale[1])))
+
+    def _frames(self, image: Surface, size: Tuple[int, int]) -> List[Surface]:
+        frames = self.frames.get((image, size))
+        if frames is None:
+            base = (image if size == image.get_size() 
+                else transform.scale(image, size))
+            frames = [base] + [transform.rotozoom(base, 360*i/self.bins, 1) 
+                for i in range(1, self.bins)]
+            self.frames[(image, size)] = frames
+        return frames
+
+    def _prepare(self, gameobject: GameObject) -> Surface:
+        """Returns the frame closest to the rotation of the GameObject."""
+
+        frames = self._frames(gameobject.image, 
+            (round(gameobject.scale.x), round(gameobject.scale.y)))
+        return frames[round(gameobject._rotation * self.bins / 360) % self.bins]
 
     def __call__(self, gameobject: GameObject, surface: Surface, area=None, 
         special_flags=0):
@@ -132,31 +345,12 @@ class BasicRenderer(GORenderer):
             area: Same as pygame.Surface.blit(). Defaults to None.
             special_flags: Same as pygame.Surface.blit(). Defaults to 0.
         """
-        
-        # Scale the GameObject texture and rotate it around its position.
-        texture = transform.rotate(transform.scale(gameobject.image, 
-            (round(gameobject.scale.x), round(gameobject.scale.y))), 
-            gameobject.rotation)
-        
-        # Check if the GameObject is within the display. If not, don't draw. 
-        if not surface.get_rect().colliderect(texture.get_rect(
-            center=tuple(gameobject.position))):
-            return
 
-        # Blit the GameObject around its centre.
-        surface.blit(
-            texture,
-            (
-                round(gameobject.position.x) - texture.get_width()//2,
-                round(gameobject.position.y) - texture.get_height()//2
-            ),
-            area=area,
-            special_flags=special_flags)
+        _blit_centred(self._prepare(gameobject), gameobject, surface, area, 
+            special_flags)
 
     def hitbox(self, gameobject: GameObject) -> Rect:
-        return transform.rotate(transform.scale(gameobject.image, 
-            (round(gameobject.scale.x), round(gameobject.scale.y))), 
-            gameobject.rotation).get_rect(center=tuple(gameobject.position))
+        return _centred_rect(self._prepare(gameobject), gameobject)
 
 class StackRenderer(GORenderer):
     """Spritestack renderer for GameObjects. Stacks multiple Surfaces to create 
@@ -183,6 +377,8 @@ class StackRenderer(GORenderer):
 class GOUpdater(ABC):
     """Base class for GameObject updaters. Useful especially when GameObjects 
     need to move on their own (e.g. Particles)."""
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self):
         pass
@@ -196,6 +392,26 @@ class GOUpdater(ABC):
         """
         pass
 
+def basic_particle_update(updater: "BasicParticleUpdater", dt: float):
+    """Moves the particle of a BasicParticleUpdater. This is the updater's 
+    __call__. GameObjects with a plain BasicParticleUpdater call it directly, 
+    skipping the updater's __call__."""
+
+    particle = updater.particle
+    system = getattr(particle, '_system', None)
+    if system is not None:
+        # The particle's state lives in its ParticleSystem. The system 
+        # integrates it itself, this is only for direct calls.
+        i = particle._index
+        system.pos[i] += system.vel[i] * dt
+        system.vel[i] += system.accel[i] * dt
+        return
+    # Mutate the vectors in place instead of going through the setters, which 
+    # would build new Vector2s every frame. The setters are only for 
+    # assignments from outside.
+    particle._position += updater._velocity * dt
+    updater._velocity += updater._accel * dt
+
 class BasicParticleUpdater(GOUpdater):
     """Basic particle motion.
 
@@ -206,6 +422,8 @@ class BasicParticleUpdater(GOUpdater):
         accel (pygame.math.Vector2 | Tuple[float, float]): Acceleration of the 
         particle. Defaults to (0.0, 0.0).
     """
+    __slots__ = ('particle', '_velocity', '_accel')
+
     def __init__(self, particle: "Particle"=None, 
         velocity: pmath.Vector2 | Tuple[float, float]=(0.0, 0.0),
         accel: pmath.Vector2 | Tuple[float, float]=(0.0, 0.0)):
@@ -214,26 +432,39 @@ class BasicParticleUpdater(GOUpdater):
         self.velocity = velocity
         self.accel = accel
 
+    # Like Particle.position, these live in the ParticleSystem's arrays while 
+    # the particle is bound to one.
     @property
     def velocity(self) -> pmath.Vector2 :
-        return self._velocity
+        system = getattr(self.particle, '_system', None)
+        if system is None:
+            return self._velocity
+        return _SlotVector.of(self, 'velocity', system.vel[self.particle._index])
 
     @property
     def accel(self) -> pmath.Vector2 :
-        return self._accel
+        system = getattr(self.particle, '_system', None)
+        if system is None:
+            return self._accel
+        return _SlotVector.of(self, 'accel', system.accel[self.particle._index])
 
     @velocity.setter
     def velocity(self, p: pmath.Vector2 | Tuple[float, float]):
-        self._velocity = pmath.Vector2(p)   # Just make sure everything is converted.
+        system = getattr(self.particle, '_system', None)
+        if system is None:
+            self._velocity = pmath.Vector2(p)   # Just make sure everything is converted.
+        else:
+            system.vel[self.particle._index] = tuple(p)
 
     @accel.setter
     def accel(self, p: pmath.Vector2 | Tuple[float, float]):
-        self._accel = pmath.Vector2(p)   # Just make sure everything is converted.
+        system = getattr(self.particle, '_system', None)
+        if system is None:
+            self._accel = pmath.Vector2(p)   # Just make sure everything is converted.
+        else:
+            system.accel[self.particle._index] = tuple(p)
 
-    def __call__(self, dt: float):
-
-        self.particle.position += self.velocity * dt
-        self.velocity += self.accel * dt
+    __call__ = basic_particle_update
 
 class Particle(GameObject):
     """Basic particles for Pygannuum.
@@ -248,46 +479,111 @@ class Particle(GameObject):
         rotation (float): Rotation of the particle. Defaults to 0.0.
         renderer (GORenderer | None): How the particle is drawn. Defaults to 
         BasicRenderer.
-        updater (GOUpdater | None): How the particle is updated. Defaults to 
-        BasicParticleMotion.
+        updater (GOUpdater | None): How the particle is updated. Defaults to a 
+        new BasicParticleUpdater.
         lifespan (float): Lifespan of the particle in seconds. If set to a 
-        negative value, the particle will be immortal. Defaults to 10.0.
+        negative value or infinity, the particle will be immortal. While in a 
+        ParticleSystem, immortal lifespans read back as infinity. Defaults to 
+        10.0.
     """
 
-    def __init__(self, texture: Surface, 
+    __slots__ = ('_system', '_index', '_lifespan')
+
+    def __init__(self, texture: Surface=None, 
         position: pmath.Vector2 | Tuple[float, float]=(0.0, 0.0), 
         scale:pmath.Vector2 | Tuple[float, float]=(10, 10), rotation: float=0.0, 
         renderer: GORenderer=None, updater=None, lifespan: float=10.0):
+        # Set by the ParticleSystem that simulates the particle, if any.
+        self._system = None
+        self._index = None
+        # GameObject.__init__ already goes through the updater setter below.
         super().__init__(texture, position, scale, rotation, renderer, updater)
 
-        self.updater = updater
         self.lifespan = lifespan
+
+    # When a ParticleSystem simulates the particle, its position and lifespan
+    # live in the system's arrays. The position is then read as a _SlotVector, 
+    # so that changing it in place still reaches the array.
+    @property
+    def position(self) -> pmath.Vector2:
+        if self._system is None:
+            return self._position
+        return _SlotVector.of(self, 'position', self._system.pos[self._index])
+
+    @property
+    def lifespan(self) -> float:
+        if self._system is None:
+            return self._lifespan
+        return float(self._system.life[self._index])
+
+    @property
+    def scale(self) -> pmath.Vector2:
+        return self._scale
     
     @property
     def updater(self) -> GOUpdater:
         return self._updater
+
+    @position.setter
+    def position(self, p: pmath.Vector2 | Tuple[float, float]):
+        if self._system is None:
+            self._position = pmath.Vector2(p)
+        else:
+            self._system.pos[self._index] = tuple(p)
+
+    @lifespan.setter
+    def lifespan(self, l: float):
+        system = self._system
+        if system is None:
+            self._lifespan = l
+        elif l == 0:
+            # Dead particles are kept out of the arrays, see add_internal().
+            system.remove_internal(self)
+            self._lifespan = l
+            system.add_internal(self)
+        else:
+            system.life[self._index] = np.inf if l < 0 else l
+
+    @scale.setter
+    def scale(self, s: pmath.Vector2 | Tuple[float, float]):
+        self._scale = pmath.Vector2(s)
+        if self._system is not None: # Keep the culling extent up to date.
+            self._system.extent[self._index] = self._system._extent(self)
     
     @updater.setter
     def updater(self, u: GOUpdater):
+        # A bound particle leaves its system while the updater is swapped, as 
+        # the new one decides whether the system can simulate it.
+        system = self._system
+        if system is not None:
+            system.remove_internal(self)
         # Ensures that the Particle always has an updater present.
         # Particles need updaters because without them, why tf would you have a particle??
-        self._updater = DEFAULT_PARTICLE_MOTION if u is None else u
+        # Each one gets its own, as an updater only moves a single particle.
+        GameObject.updater.fset(self, BasicParticleUpdater() if u is None else u)
         self._updater.particle = self
+        if system is not None:
+            system.add_internal(self)
 
-    def update(self, dt: float, base_fps: int=60):
+    def update(self, dt: float, base_fps: int=60, dt_over_fps: float=None):
         """Update the particle's state.
 
         Args:
             dt (float): Delta-time. Allows for framerate independence.
             base_fps (int, optional): Base framerate of the game. Defaults to 60.
+            dt_over_fps (float, optional): dt/base_fps, for callers updating 
+            many particles with the same dt. Overrides base_fps if given.
         """
+        if dt_over_fps is None:
+            dt_over_fps = dt/base_fps
         # Values, let l be lifespan: l>0: alive; l==0: dead; l<0: immortal.
         if self.lifespan > 0: # If the particle is alive...
             super().update(dt) # update it...
-            self.lifespan -= dt/base_fps # then update its lifespan...
-            if self.lifespan <= 0: # If the lifespan falls below zero after the update (since delta-time isn't a constant 1 or smth).
-                self.kill() # remove particle from (all) ParticleSystems...
-                self.lifespan = 0.0 # then ensure that the particle stays dead.
+            # then update its lifespan, clamped at 0 so that it can't read as 
+            # immortal...
+            self.lifespan = max(self.lifespan - dt_over_fps, 0.0)
+            if self.lifespan == 0: # If the lifespan ran out after the update (since delta-time isn't a constant 1 or smth).
+                self.kill() # remove particle from (all) ParticleSystems.
         elif self.lifespan == 0:
             return
         else: # If the particle is immortal, just keep updating it.
@@ -298,35 +594,344 @@ class Particle(GameObject):
             return
         super().draw(surface, area, special_flags)
 
+# Layout of one particle in a ParticleSystem, 32 bytes without padding. The 
+# system's pos, vel, accel, life and extent arrays are views of its fields.
+PARTICLE_DTYPE = np.dtype([('pos', np.float32, 2), ('vel', np.float32, 2), 
+    ('accel', np.float32, 2), ('life', np.float32), ('extent', np.float32)])
+
+# Integrates the first n particles of a ParticleSystem's arrays. Lifespans are
+# clamped at 0, immortal particles are stored with an infinite lifespan so they 
+# need no special case. fastmath must not assume away infinities. The compiled 
+# kernel spreads the particles over all cores and releases the GIL meanwhile.
+if njit is not None:
+    @njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, 
+        parallel=True, nogil=True)
+    def _integrate(pos, vel, accel, life, dt, dt_fps, n):
+        for i in prange(n):
+            pos[i, 0] += vel[i, 0] * dt
+            pos[i, 1] += vel[i, 1] * dt
+            vel[i, 0] += accel[i, 0] * dt
+            vel[i, 1] += accel[i, 1] * dt
+            life[i] = max(life[i] - dt_fps, 0.0)
+else:
+    def _integrate(pos, vel, accel, life, dt, dt_fps, n):
+        pos, vel, life = pos[:n], vel[:n], life[:n]
+        pos += vel * dt
+        vel += accel[:n] * dt
+        np.subtract(life, dt_fps, out=life)
+        np.maximum(life, 0.0, out=life)
+
+# Compile (or load from cache) now rather than during the first frame. The 
+# arguments must be (non-contiguous) field views like the real ones to hit the 
+# same signature.
+_parts = np.zeros(2, dtype=PARTICLE_DTYPE)
+_integrate(_parts['pos'], _parts['vel'], _parts['accel'], _parts['life'], 0.0, 
+    0.0, 1)
+del _parts
+
 class ParticleSystem(sprite.Group):
-    def __init__(self, particle: Particle=None):
+    """Particle systems for Pygannuum. Live particles moved by a plain 
+    BasicParticleUpdater are simulated together: their position, velocity, 
+    acceleration and lifespan are kept in a PARTICLE_DTYPE array owned by the 
+    system, and the Particle objects only act as views into it. Other sprites 
+    are updated one by one. Particles spawned in bulk with spawn_batch() only 
+    exist in the array, as copies of the system's particle. They don't count 
+    towards len(), n is the number of particles in the array, and are drawn 
+    before the sprites of the group.
+
+    Args:
+        particle (Particle | None): Particle emitted by the system. Defaults to 
+        DEFAULT_PARTICLE.
+        capacity (int): Number of particles the arrays hold before they have to 
+        grow. Defaults to 1024.
+        spread (pygame.math.Vector2 | Tuple[float, float]): How far the 
+        velocity of emitted particles may randomly stray from that of the 
+        system's particle, along each axis. Defaults to (1.0, 1.0).
+        seed (int | numpy.random.Generator | None): Seed of the random spread, 
+        or the Generator to draw it from. Defaults to None, for a fresh seed.
+    """
+
+    def __init__(self, particle: Particle=None, capacity: int=1024, 
+        spread: pmath.Vector2 | Tuple[float, float]=(1.0, 1.0), seed=None):
         super().__init__()
 
         self.particle = particle
+        self.spread = spread
+        self._rng = np.random.default_rng(seed)
+
+        self.capacity = capacity
+        self.n = 0 # Number of live particles in the arrays.
+        self.parts = np.empty(capacity, dtype=PARTICLE_DTYPE)
+        self._split_fields()
+        self._views = [None] * capacity # Particle object of each array slot.
+        self._others = {} # Particles that are updated one by one.
 
     @property
     def particle(self) -> Particle:
         return self._particle
     
+    @property
+    def spread(self) -> pmath.Vector2:
+        return self._spread
+
     @particle.setter
     def particle(self, p: Particle):
         self._particle = DEFAULT_PARTICLE if p is None else p
 
+    @spread.setter
+    def spread(self, s: pmath.Vector2 | Tuple[float, float]):
+        self._spread = pmath.Vector2(s)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        # Only plain BasicParticleUpdaters, a subclass may move its particle 
+        # in ways the arrays can't. Dead particles stay out of the arrays too, 
+        # or the next update() would remove them from the group.
+        if (isinstance(sprite, Particle) and sprite._system is None
+            and type(sprite.updater) is BasicParticleUpdater
+            and sprite._lifespan != 0):
+            self._bind(sprite)
+        else:
+            self._others[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if isinstance(sprite, Particle) and sprite._system is self:
+            self._free(sprite._index)
+        else:
+            self._others.pop(sprite, None)
+
+    def _split_fields(self):
+        """Exposes the fields of the particle array as separate arrays."""
+
+        self.pos = self.parts['pos']
+        self.vel = self.parts['vel']
+        self.accel = self.parts['accel']
+        self.life = self.parts['life']
+        self.extent = self.parts['extent'] # For culling.
+
+    def _grow(self):
+        """Doubles the capacity of the particle array."""
+
+        capacity = max(1, self.capacity * 2)
+        parts = np.empty(capacity, dtype=PARTICLE_DTYPE)
+        parts[:self.n] = self.parts[:self.n]
+        self.parts = parts
+        self._split_fields()
+        self._views.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    @staticmethod
+    def _extent(particle: Particle) -> float:
+        """Returns how far the texture of a particle can reach from its 
+        centre, whatever its rotation."""
+
+        return particle.scale.length()/2 + 1 # Leave a pixel for rounding.
+
+    def _bind(self, particle: Particle):
+        """Moves the state of a particle into the next free array slot."""
+
+        if self.n == self.capacity:
+            self._grow()
+        i = self.n
+        self.pos[i] = tuple(particle._position)
+        self.vel[i] = tuple(particle.updater.velocity)
+        self.accel[i] = tuple(particle.updater.accel)
+        self.life[i] = np.inf if particle._lifespan < 0 else particle._lifespan
+        self.extent[i] = self._extent(particle)
+        self._views[i] = particle
+        particle._system, particle._index = self, i
+        self.n += 1
+
+    def _hand_back(self, i: int) -> Particle | None:
+        """Hands the state of slot i back to its particle and returns the 
+        particle, if the slot has one."""
+
+        particle = self._views[i]
+        if particle is not None:
+            # Unbind first, so the updater's setters don't write to the array.
+            particle._system, particle._index = None, None
+            particle._position = pmath.Vector2(self.pos[i].tolist())
+            particle.updater.velocity = self.vel[i].tolist()
+            particle.updater.accel = self.accel[i].tolist()
+            particle._lifespan = float(self.life[i])
+        return particle
+
+    def _free(self, i: int):
+        """Frees slot i, handing its state back to its particle if it has one, 
+        and fills it with the last slot."""
+
+        self._hand_back(i)
+        last = self.n - 1
+        if i != last:
+            self.parts[i] = self.parts[last]
+            self._views[i] = self._views[last]
+            if self._views[i] is not None:
+                self._views[i]._index = i
+        self._views[last] = None
+        self.n = last
+
+    def spawn_batch(self, n: int, position=(0.0, 0.0), velocity=(0.0, 0.0), 
+        accel=(0.0, 0.0), lifespan: float=None):
+        """Spawns n copies of the system's particle straight into the array, 
+        without creating Particle objects. They share the texture, scale, 
+        rotation and renderer of the system's particle.
+
+        Args:
+            n (int): Number of particles to spawn.
+            position (pygame.math.Vector2 | Tuple[float, float] | 
+            numpy.ndarray): Position of the particles, one for all of them or 
+            an (n, 2) array. Defaults to (0.0, 0.0).
+            velocity (pygame.math.Vector2 | Tuple[float, float] | 
+            numpy.ndarray): Velocity of the particles, same as position. 
+            Defaults to (0.0, 0.0).
+            accel (pygame.math.Vector2 | Tuple[float, float] | numpy.ndarray): 
+            Acceleration of the particles, same as position. Defaults to 
+            (0.0, 0.0).
+            lifespan (float | numpy.ndarray | None): Lifespan of the particles, 
+            one for all of them or an (n,) array. Defaults to the lifespan of 
+            the system's particle.
+        """
+        while self.n + n > self.capacity:
+            self._grow()
+        i0, i1 = self.n, self.n + n
+        self.pos[i0:i1] = np.asarray(position, dtype=np.float32)
+        self.vel[i0:i1] = np.asarray(velocity, dtype=np.float32)
+        self.accel[i0:i1] = np.asarray(accel, dtype=np.float32)
+        life = np.asarray(self.particle.lifespan if lifespan is None 
+            else lifespan, dtype=np.float32)
+        self.life[i0:i1] = np.where(life < 0, np.inf, life)
+        self.extent[i0:i1] = self._extent(self.particle)
+        self.n = i1
+
     def spawn_particle(self, rate: int=10):
-        pass
+        """Emits copies of the system's particle at its position, with their 
+        velocities randomly spread around its velocity. They are written to the 
+        array all at once, see spawn_batch(). Call it every frame for a steady 
+        stream.
+
+        Args:
+            rate (int): Number of particles to emit. Defaults to 10.
+        """
+        template = self.particle
+        # Only a BasicParticleUpdater's motion carries over to the array.
+        velocity = getattr(template.updater, 'velocity', (0.0, 0.0))
+        accel = getattr(template.updater, 'accel', (0.0, 0.0))
+        spread = self._rng.uniform(-1.0, 1.0, (rate, 2)) * tuple(self.spread)
+        self.spawn_batch(rate, template.position, spread + tuple(velocity), 
+            accel, template.lifespan)
+
+    def _compact(self):
+        """Removes the dead particles from the array in one pass, moving live 
+        ones from the tail into the slots they leave."""
+
+        n = self.n
+        dead = np.flatnonzero(self.life[:n] == 0)
+        if not len(dead):
+            return
+        live = n - len(dead)
+
+        # Hand the dead their state back first, before it gets overwritten.
+        killed = [particle for particle in map(self._hand_back, dead.tolist()) 
+            if particle is not None]
+
+        # Every dead slot left of the live count takes a live one from the tail.
+        holes = dead[dead < live]
+        tail = np.arange(live, n)
+        movers = tail[self.life[live:n] != 0]
+        self.parts[holes] = self.parts[movers]
+        views = self._views
+        for hole, mover in zip(holes.tolist(), movers.tolist()):
+            particle = views[hole] = views[mover]
+            if particle is not None:
+                particle._index = hole
+        views[live:n] = [None] * (n - live)
+        self.n = live
+
+        # Already unbound, so this only takes them out of their Groups.
+        for particle in killed:
+            particle.kill()
+            particle.lifespan = 0.0
 
     def update(self, dt: float, base_fps: int=60):
-        for particle in self:
-            particle.update(dt, base_fps)
+        dt_fps = dt/base_fps # Shared by every particle this step.
+        # Plain floats, so that NumPy scalars don't compile another signature.
+        _integrate(self.pos, self.vel, self.accel, self.life, float(dt), 
+            float(dt_fps), self.n)
+        self._compact()
+
+        for particle in tuple(self._others):
+            if isinstance(particle, Particle):
+                particle.update(dt, dt_over_fps=dt_fps)
+            else:
+                particle.update(dt)
 
     def draw(self, surface: Surface, area=None, special_flags=0):
-        for particle in self:
-            particle.draw(surface, area, special_flags)
+        """Draws the particles spawned in bulk first, in no particular order, 
+        then the sprites of the group in the order it holds them."""
+
+        n, views, template = self.n, self._views, self.particle
+        pos, extent = self.pos[:n], self.extent[:n]
+        # Skip dead slots, and cull the ones that are off the surface all at 
+        # once. Only batched renderers are culled (see below), as other ones 
+        # may draw anywhere.
+        width, height = surface.get_size()
+        alive = self.life[:n] > 0
+        visible = (alive
+            & (pos[:, 0] + extent > 0) & (pos[:, 0] - extent < width)
+            & (pos[:, 1] + extent > 0) & (pos[:, 1] - extent < height))
+        alive, visible, pos = alive.tolist(), visible.tolist(), pos.tolist()
+        bulk = ((template, i) for i in range(n) if views[i] is None)
+        group = ((sprite, sprite._index 
+            if isinstance(sprite, Particle) and sprite._system is self else None) 
+            for sprite in self.spritedict)
+        # Sprites with a plain BasicRenderer or RotationLUTRenderer get blitted 
+        # in batches, the off-screen ones that weren't culled are simply 
+        # clipped away by pygame.
+        batch = []
+        for particle, i in chain(bulk, group):
+            if i is None: # Not in the array.
+                if isinstance(particle, Particle) and particle.lifespan == 0:
+                    continue
+                x, y = particle.position
+            elif not alive[i]:
+                continue
+            else:
+                x, y = pos[i]
+            renderer = particle._renderer
+            if type(renderer) in (BasicRenderer, RotationLUTRenderer):
+                if i is not None and not visible[i]:
+                    continue
+                texture = renderer._prepare(particle)
+                batch.append((
+                    texture,
+                    (
+                        round(x) - texture.get_width()//2,
+                        round(y) - texture.get_height()//2
+                    ),
+                    area,
+                    special_flags))
+                continue
+            # Blit what came before first, to keep the drawing order.
+            surface.blits(batch, doreturn=False)
+            batch.clear()
+            if i is not None and views[i] is None:
+                # Stand in for a bulk spawned particle, then put the emitter 
+                # back where it was.
+                position = tuple(template.position)
+                template.position = (x, y)
+                try:
+                    template._render_fn(template, surface, area, special_flags)
+                finally:
+                    template.position = position
+            else:
+                particle.draw(surface, area, special_flags)
+        surface.blits(batch, doreturn=False)
 
 # More defaults...
-DEFAULT_PARTICLE = 0 # Add textures immediately !
-DEFAULT_PARTICLE_MOTION = BasicParticleUpdater()
-DEFAULT_RENDERER = BasicRenderer()
+DEFAULT_TEXTURE = Surface((1, 1), SRCALPHA) # Transparent, shared by all.
+DEFAULT_RENDERER = BasicRenderer() # Stateless, so it can be shared.
+DEFAULT_PARTICLE = Particle()
 
 # Testing stuff
 if __name__ == '__main__':
@@ -0,0 +1,552 @@
+# Tests for gameobject. Run with pytest, no display is needed.
+import importlib.util
+import random
+import sys
+
+import numpy as np
+import pygame
+import pytest
+
+import gameobject
+
+from gameobject import (BasicParticleUpdater, BasicRenderer, GameObject, GORenderer, 
+    Particle, ParticleSystem, RotationLUTRenderer, basic_particle_update, 
+    basic_render)
+
+def make_texture(colour=(255, 0, 0), size=(4, 4)) -> pygame.Surface:
+    texture = pygame.Surface(size)
+    texture.fill(colour)
+    return texture
+
+TEXTURE = make_texture()
+
+def test_texture_cache():
+    gameobject = GameObject(TEXTURE, (5, 5), rotation=30)
+    renderer = gameobject.renderer
+    texture = renderer._prepare(gameobject)
+    assert renderer._prepare(gameobject) is texture
+    gameobject.rotation = 30.4 # Snapped to the same degree.
+    assert renderer._prepare(gameobject) is texture
+    gameobject.rotation = 31
+    assert renderer._prepare(gameobject) is not texture
+
+def test_image_setter_drops_cache():
+    gameobject = GameObject(TEXTURE, (5, 5), rotation=30)
+    texture = gameobject.renderer._prepare(gameobject)
+    gameobject.image = make_texture((0, 255, 0))
+    assert gameobject.renderer._prepare(gameobject) is not texture
+
+def test_invalidate_texture():
+    image = TEXTURE.copy()
+    gameobject = GameObject(image, (5, 5), rotation=30)
+    surface = pygame.Surface((10, 10))
+    gameobject.draw(surface)
+    image.fill((0, 255, 0))
+    gameobject.invalidate_texture()
+    gameobject.draw(surface)
+    assert surface.get_at((5, 5)) == (0, 255, 0, 255)
+
+@pytest.mark.parametrize('smooth, size', [(True, (12, 12)), (False, (11, 11))])
+def test_smooth(smooth, size):
+    gameobject = GameObject(TEXTURE, scale=(8, 8), rotation=45, 
+        renderer=BasicRenderer(smooth))
+    assert gameobject.rect.size == size
+    # Non-uniform scales always go through rotate(scale()).
+    gameobject.scale = (8, 6)
+    expected = pygame.transform.rotate(pygame.transform.scale(TEXTURE, (8, 6)), 
+        45)
+    assert gameobject.renderer.hitbox(gameobject).size == expected.get_size()
+
+def make_particle(position=(0.0, 0.0), velocity=(0.0, 0.0), accel=(0.0, 0.0), 
+    lifespan=10.0, **kwargs) -> Particle:
+    return Particle(TEXTURE, position, 
+        updater=BasicParticleUpdater(velocity=velocity, accel=accel), 
+        lifespan=lifespan, **kwargs)
+
+class FillRenderer(GORenderer):
+    """Covers the whole surface, to check the drawing order."""
+
+    def __init__(self, colour=(0, 0, 255)):
+        self.colour = colour
+
+    def __call__(self, gameobject, surface, area=None, special_flags=0):
+        surface.fill(self.colour)
+
+    def hitbox(self, gameobject):
+        return pygame.Rect(0, 0, 1, 1)
+
+def test_draw_gameobjects():
+    ps = ParticleSystem()
+    ps.add(GameObject(TEXTURE, (5, 5)))
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (255, 0, 0, 255)
+
+def test_dead_particles_not_drawn():
+    ps = ParticleSystem()
+    ps.add(make_particle((5, 5), lifespan=0))
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (0, 0, 0, 255)
+
+def test_draw_order():
+    ps = ParticleSystem()
+    ps.add(make_particle((2, 2), scale=(4, 4)), 
+        GameObject(TEXTURE, renderer=FillRenderer()), 
+        GameObject(TEXTURE, (7, 7), (4, 4)))
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((2, 2)) == (0, 0, 255, 255)
+    assert surface.get_at((7, 7)) == (255, 0, 0, 255)
+
+class FillingBasicRenderer(BasicRenderer):
+    def __call__(self, gameobject, surface, area=None, special_flags=0):
+        surface.fill((0, 0, 255))
+
+def test_basic_renderer_subclass_not_batched():
+    ps = ParticleSystem()
+    ps.add(GameObject(TEXTURE, (5, 5), renderer=FillingBasicRenderer()))
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((0, 0)) == (0, 0, 255, 255)
+
+def check_slots(ps: ParticleSystem):
+    """Asserts that the arrays and the Particles viewing them agree."""
+
+    for i in range(ps.n):
+        view = ps._views[i]
+        assert view is None or (view._system is ps and view._index == i)
+    assert all(view is None for view in ps._views[ps.n:])
+    assert (ps.life[:ps.n] > 0).all()
+    assert sum(view is not None for view in ps._views[:ps.n]) == sum(
+        isinstance(p, Particle) and p._system is ps for p in ps)
+
+def test_add_binds_particle():
+    ps = ParticleSystem()
+    p = make_particle((1, 2), velocity=(3, 4), accel=(5, 6))
+    ps.add(p)
+    assert p._system is ps and ps.n == 1 and len(ps) == 1
+    assert ps.pos[0].tolist() == [1, 2]
+    assert ps.vel[0].tolist() == [3, 4]
+    assert ps.accel[0].tolist() == [5, 6]
+    assert ps.life[0] == 10
+    check_slots(ps)
+
+def test_remove_hands_state_back():
+    ps = ParticleSystem(capacity=2)
+    particles = [make_particle((i, 0), velocity=(1, 0), accel=(0, 1)) 
+        for i in range(5)] # Also makes the arrays grow.
+    ps.add(*particles)
+    ps.update(1)
+    ps.remove(particles[1])
+    check_slots(ps)
+    p = particles[1]
+    assert p._system is None and ps.n == 4
+    assert p.position == pygame.Vector2(2, 0)
+    assert p.updater.velocity == pygame.Vector2(1, 1)
+    assert p.updater.accel == pygame.Vector2(0, 1)
+    assert p.lifespan == pytest.approx(10 - 1/60)
+    # The slot it left is now used by another particle.
+    for x, q in enumerate(particles):
+        if q is not p:
+            assert q.position == pygame.Vector2(x + 1, 0)
+
+def test_kill():
+    ps = ParticleSystem()
+    a, b = make_particle((1, 1)), make_particle((2, 2))
+    ps.add(a, b)
+    a.kill()
+    check_slots(ps)
+    assert len(ps) == 1 and ps.n == 1
+    assert a._system is None and a.position == pygame.Vector2(1, 1)
+    assert b.position == pygame.Vector2(2, 2)
+
+def test_bound_state_writes_through():
+    ps = ParticleSystem()
+    p = make_particle(velocity=(1, 0), lifespan=-1)
+    ps.add(p)
+    p.updater.velocity = (0, 5)
+    assert ps.vel[0].tolist() == [0, 5]
+    p.updater.velocity.x += 1
+    assert ps.vel[0].tolist() == [1, 5]
+    p.position.x += 10
+    assert ps.pos[0].tolist() == [10, 0]
+    p.update(1) # Direct calls go through the array too.
+    assert ps.pos[0].tolist() == [11, 5]
+
+def test_new_updater_rebinds():
+    ps = ParticleSystem()
+    p = make_particle()
+    ps.add(p)
+    p.updater = BasicParticleUpdater(velocity=(2, 2))
+    assert p._system is ps and ps.vel[p._index].tolist() == [2, 2]
+    p.updater = SpinningUpdater()
+    assert p._system is None and p in ps
+    check_slots(ps)
+
+class SpinningUpdater(BasicParticleUpdater):
+    def __call__(self, dt):
+        super().__call__(dt)
+        self.particle.rotation += 10
+
+def test_updater_subclass_not_simulated():
+    ps = ParticleSystem()
+    p = make_particle(velocity=(1, 0))
+    p.updater = SpinningUpdater(velocity=(1, 0))
+    ps.add(p)
+    ps.update(1)
+    assert p._system is None
+    assert p.rotation == 10 and p.position == pygame.Vector2(1, 0)
+
+def test_dead_particles_kept():
+    ps = ParticleSystem()
+    dead, alive = make_particle(lifespan=0), make_particle()
+    ps.add(dead, alive)
+    alive.lifespan = 0
+    ps.update(1)
+    assert dead in ps and alive in ps and ps.n == 0
+
+def test_gameobjects_in_system():
+    ps = ParticleSystem()
+    ps.add(GameObject(TEXTURE, (5, 5)))
+    ps.update(1)
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (255, 0, 0, 255)
+
+def test_draw_order_bound():
+    ps = ParticleSystem()
+    ps.add(GameObject(TEXTURE, (5, 5), (4, 4)), 
+        Particle(make_texture((0, 255, 0)), (5, 5), (4, 4), 
+            updater=BasicParticleUpdater()))
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (0, 255, 0, 255)
+
+def load_without_numba(monkeypatch):
+    """Imports a second copy of gameobject that can't import Numba."""
+
+    monkeypatch.setitem(sys.modules, 'numba', None)
+    spec = importlib.util.spec_from_file_location('gameobject_numpy', 
+        gameobject.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_numpy_integrate_matches(monkeypatch):
+    numpy_only = load_without_numba(monkeypatch)
+    assert numpy_only.njit is None
+    systems = []
+    for module in (gameobject, numpy_only):
+        ps = module.ParticleSystem()
+        ps.add(*(module.Particle(TEXTURE, (i, 0), 
+            updater=module.BasicParticleUpdater(velocity=(1, i), accel=(0, 2)), 
+            lifespan=[-1, 0.05, 1][i % 3]) for i in range(9)))
+        for _ in range(4):
+            ps.update(1)
+        systems.append(ps)
+    a, b = systems
+    assert a.n == b.n == 6
+    for name in ('pos', 'vel', 'accel', 'life'):
+        assert np.allclose(getattr(a, name)[:a.n], getattr(b, name)[:b.n])
+
+@pytest.mark.skipif(gameobject.njit is None, reason='needs Numba')
+def test_numpy_scalars_reuse_signature():
+    ps = ParticleSystem()
+    ps.add(make_particle(velocity=(1, 0)))
+    signatures = len(gameobject._integrate.signatures)
+    ps.update(np.float32(1), np.float32(60))
+    ps.update(np.int64(1), np.int64(60))
+    assert len(gameobject._integrate.signatures) == signatures
+
+def test_updater_moves_in_place():
+    p = make_particle(velocity=(1, 0), accel=(0, 1))
+    position, velocity = p.position, p.updater.velocity
+    p.update(2)
+    assert p.position is position and p.updater.velocity is velocity
+    assert position == pygame.Vector2(2, 0) and velocity == pygame.Vector2(1, 2)
+
+def test_dt_over_fps():
+    a, b = make_particle(lifespan=1), make_particle(lifespan=1)
+    a.update(3, base_fps=60)
+    b.update(3, dt_over_fps=3/60)
+    assert a.lifespan == b.lifespan == pytest.approx(0.95)
+
+def test_immortal_lifespan():
+    ps = ParticleSystem()
+    p = make_particle(lifespan=-1)
+    ps.add(p)
+    assert ps.life[0] == np.inf and p.lifespan == np.inf
+    ps.update(1000)
+    assert p._system is ps and p.lifespan == np.inf
+
+def test_dead_slot_not_drawn():
+    ps = ParticleSystem()
+    ps.add(make_particle((5, 5)))
+    ps.life[0] = 0 # Dies this frame, before the next update() removes it.
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (0, 0, 0, 255)
+
+def test_bound_particle_dies_on_direct_update():
+    ps = ParticleSystem()
+    p = make_particle(lifespan=0.5/60)
+    ps.add(p)
+    p.update(1) # Overshoots, which must not read as immortal.
+    assert p.lifespan == 0 and p not in ps and ps.n == 0
+
+def test_cull_off_surface():
+    ps = ParticleSystem()
+    inside, outside = make_particle((5, 5)), make_particle((-20, 5))
+    ps.add(inside, outside)
+    for p in (inside, outside):
+        p.rotation = 45 # Its texture now needs to be rebuilt.
+    key = outside._xform_key
+    ps.draw(pygame.Surface((10, 10)))
+    assert outside._xform_key == key and inside._xform_key != key
+
+def test_cull_extent_follows_scale():
+    ps = ParticleSystem()
+    p = make_particle((-10, 5), scale=(4, 4))
+    ps.add(p)
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((0, 5)) == (0, 0, 0, 255)
+    p.scale = (30, 30)
+    ps.draw(surface)
+    assert surface.get_at((0, 5)) == (255, 0, 0, 255)
+
+class CircleRenderer(GORenderer):
+    """Draws well outside the particle's scale."""
+
+    def __init__(self):
+        pass
+
+    def __call__(self, gameobject, surface, area=None, special_flags=0):
+        position = gameobject.position
+        pygame.draw.circle(surface, (0, 255, 0), 
+            (round(position.x), round(position.y)), 30)
+
+    def hitbox(self, gameobject):
+        return pygame.Rect(0, 0, 1, 1)
+
+def test_custom_renderers_not_culled():
+    ps = ParticleSystem()
+    p = make_particle((-10, 5), renderer=CircleRenderer())
+    ps.add(p)
+    assert p._system is ps
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (0, 255, 0, 255)
+
+def test_rotation_zero_uses_image():
+    gameobject = GameObject(TEXTURE, scale=TEXTURE.get_size())
+    assert gameobject.renderer._prepare(gameobject) is TEXTURE
+    gameobject.rotation = 0.4 # Still snaps to 0°.
+    assert gameobject.renderer._prepare(gameobject) is TEXTURE
+    gameobject.scale = (8, 4) # Scaled but not rotated.
+    texture = gameobject.renderer._prepare(gameobject)
+    assert texture is not TEXTURE and texture.get_size() == (8, 4)
+
+def test_direct_calls():
+    gameobject = GameObject(TEXTURE)
+    assert gameobject._render_fn is basic_render
+    gameobject.renderer = FillRenderer()
+    assert gameobject._render_fn is gameobject.renderer
+    p = make_particle(velocity=(1, 0))
+    assert p._update_fn is basic_particle_update
+    p.update(1)
+    assert p.position == pygame.Vector2(1, 0)
+    p.updater = SpinningUpdater(velocity=(1, 0))
+    assert p._update_fn is None
+    p.update(1)
+    assert p.rotation == 10 and p.position == pygame.Vector2(2, 0)
+
+class DelegatingRenderer(FillRenderer):
+    def __call__(self, gameobject, surface, area=None, special_flags=0):
+        basic_render(gameobject, surface, area, special_flags)
+
+def test_basic_render_from_other_renderers():
+    gameobject = GameObject(TEXTURE, (5, 5), renderer=DelegatingRenderer())
+    surface = pygame.Surface((10, 10))
+    gameobject.draw(surface)
+    assert surface.get_at((5, 5)) == (255, 0, 0, 255)
+
+def test_slots():
+    assert not hasattr(BasicParticleUpdater(), '__dict__')
+    p = make_particle()
+    # Sprite still gives them a __dict__, but only for its own bookkeeping.
+    assert not {'_position', '_updater', '_render_fn', '_system', '_lifespan'} & set(
+        vars(p))
+
+def test_fields_view_one_array():
+    ps = ParticleSystem(capacity=1)
+    ps.add(make_particle((1, 2), velocity=(3, 4)), make_particle((5, 6)))
+    assert ps.parts.dtype.itemsize == 32 and ps.capacity == 2
+    for name in ('pos', 'vel', 'accel', 'life', 'extent'):
+        assert np.shares_memory(getattr(ps, name), ps.parts)
+    assert ps.parts[0]['pos'].tolist() == [1, 2]
+    assert ps.parts[0]['vel'].tolist() == [3, 4]
+
+def test_lut_frame_selection():
+    renderer = RotationLUTRenderer(bins=36)
+    frames = renderer.preload(TEXTURE, (10, 10))
+    assert len(frames) == 36 and frames[0].get_size() == (10, 10)
+    assert renderer.preload(TEXTURE, (10.2, 9.8)) is frames # Cached.
+    gameobject = GameObject(TEXTURE, renderer=renderer)
+    for rotation, frame in ((0, 0), (14, 1), (16, 2), (354, 35), (356, 0), 
+        (-10, 35), (370, 1), (725, 0)):
+        gameobject.rotation = rotation
+        assert renderer._prepare(gameobject) is frames[frame]
+
+def test_lut_frames_shared():
+    renderer = RotationLUTRenderer()
+    a = GameObject(TEXTURE, rotation=90, renderer=renderer)
+    b = GameObject(TEXTURE, rotation=90, renderer=renderer)
+    assert renderer._prepare(a) is renderer._prepare(b)
+    assert len(renderer.frames) == 1
+
+def test_lut_batched(monkeypatch):
+    def fail(*args):
+        raise AssertionError('not batched')
+    monkeypatch.setattr(RotationLUTRenderer, '__call__', fail)
+    renderer = RotationLUTRenderer()
+    ps = ParticleSystem()
+    ps.add(make_particle((5, 5), lifespan=-1), 
+        GameObject(make_texture((0, 255, 0)), (15, 5), renderer=renderer))
+    ps.sprites()[0].renderer = renderer
+    surface = pygame.Surface((20, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (255, 0, 0, 255)
+    assert surface.get_at((15, 5)) == (0, 255, 0, 255)
+
+def test_default_updaters_not_shared():
+    a, b = Particle(TEXTURE), Particle(TEXTURE)
+    assert a.updater is not b.updater
+    assert a.updater.particle is a and b.updater.particle is b
+
+def test_default_texture():
+    a, b = GameObject(), Particle()
+    assert a.image is b.image is gameobject.DEFAULT_TEXTURE
+    surface = pygame.Surface((10, 10))
+    a.draw(surface) # Transparent, so nothing shows.
+    assert surface.get_at((0, 0)) == (0, 0, 0, 255)
+
+def test_rotation_wrapped_lazily():
+    gameobject = GameObject(TEXTURE, rotation=-30)
+    assert gameobject._rotation == -30 and gameobject.rotation == 330
+    gameobject.rotation += 400
+    assert gameobject._rotation == 730 and gameobject.rotation == 10
+    # Renderers wrap the angle they use.
+    same = GameObject(TEXTURE, rotation=10)
+    assert (BasicRenderer()._prepare(gameobject).get_size() 
+        == BasicRenderer()._prepare(same).get_size())
+    assert gameobject._xform_key[2] == 10
+
+class BrokenUpdater(BasicParticleUpdater):
+    def __call__(self, dt):
+        raise TypeError('broken')
+
+def test_updater_errors_propagate():
+    gameobject = GameObject(TEXTURE)
+    gameobject.update(1) # No updater, nothing happens.
+    gameobject.updater = BrokenUpdater()
+    with pytest.raises(TypeError, match='broken'):
+        gameobject.update(1)
+
+@pytest.mark.parametrize('renderer', [BasicRenderer(), RotationLUTRenderer()])
+def test_hitbox_matches_drawing(renderer):
+    ps = ParticleSystem()
+    p = Particle(TEXTURE, (4.6, 5.4), (4, 4), renderer=renderer)
+    ps.add(p) # The position now lives in the array.
+    p.position = (5.6, 4.4)
+    surface = pygame.Surface((12, 12), pygame.SRCALPHA)
+    renderer(p, surface)
+    assert renderer.hitbox(p) == surface.get_bounding_rect() == pygame.Rect(4, 2, 4, 4)
+
+def test_spawn_batch():
+    ps = ParticleSystem(Particle(TEXTURE, lifespan=-1), capacity=2)
+    ps.add(make_particle())
+    ps.spawn_batch(3, position=[(1, 1), (2, 2), (3, 3)], velocity=(1, 0))
+    assert ps.n == 4 and len(ps) == 1 # Grown, and not in the group.
+    assert ps.pos[1:4].tolist() == [[1, 1], [2, 2], [3, 3]]
+    assert (ps.vel[1:4] == (1, 0)).all() and (ps.life[1:4] == np.inf).all()
+    assert ps._views[1:4] == [None]*3
+    check_slots(ps)
+
+def test_bulk_particles_die():
+    ps = ParticleSystem(Particle(TEXTURE, lifespan=1.5/60))
+    p = make_particle(lifespan=-1)
+    ps.spawn_batch(2)
+    ps.add(p)
+    ps.spawn_batch(2, lifespan=-1)
+    ps.update(1)
+    ps.update(1)
+    assert ps.n == 3 and p._system is ps
+    assert ps._views[:3].count(None) == 2 and p in ps._views[:3]
+    check_slots(ps)
+
+def test_emitter_keeps_its_position():
+    emitter = Particle(TEXTURE, (50, 50), (4, 4), renderer=DelegatingRenderer())
+    ps = ParticleSystem(emitter)
+    ps.spawn_batch(2, position=[(3, 3), (20, 20)])
+    surface = pygame.Surface((60, 60))
+    ps.draw(surface)
+    assert emitter.position == pygame.Vector2(50, 50)
+    assert surface.get_at((3, 3)) == (255, 0, 0, 255)
+    assert surface.get_at((20, 20)) == (255, 0, 0, 255)
+    assert surface.get_at((50, 50)) == (0, 0, 0, 255)
+
+def test_bulk_drawn_first():
+    ps = ParticleSystem(Particle(make_texture((0, 255, 0)), scale=(4, 4)))
+    ps.add(make_particle((5, 5), lifespan=-1))
+    ps.sprites()[0].scale = (4, 4)
+    ps.spawn_batch(1, position=(5, 5))
+    surface = pygame.Surface((10, 10))
+    ps.draw(surface)
+    assert surface.get_at((5, 5)) == (255, 0, 0, 255)
+
+def test_spawn_particle_spread():
+    template = Particle(TEXTURE, (5, 6), lifespan=2,
+        updater=BasicParticleUpdater(velocity=(10, -10), accel=(0, 1)))
+    ps = ParticleSystem(template, capacity=4, spread=(2, 0.5))
+    ps.spawn_particle(100)
+    assert ps.n == 100 and len(ps) == 0
+    assert (ps.pos[:100] == (5, 6)).all() and (ps.accel[:100] == (0, 1)).all()
+    assert (ps.life[:100] == 2).all()
+    vel = ps.vel[:100]
+    assert (abs(vel[:, 0] - 10) <= 2).all() and (abs(vel[:, 1] + 10) <= 0.5).all()
+    assert vel[:, 0].std() > 0.5 # Actually spread out.
+
+def test_spawn_particle_seed():
+    a, b = ParticleSystem(seed=3), ParticleSystem(seed=3)
+    c = ParticleSystem(seed=np.random.default_rng(3))
+    for ps in (a, b, c):
+        ps.spawn_particle(5)
+    assert (a.vel[:5] == b.vel[:5]).all() and (a.vel[:5] == c.vel[:5]).all()
+
+def test_death_compaction_mixed():
+    rng = random.Random(5)
+    ps = ParticleSystem(Particle(TEXTURE, lifespan=0.3), capacity=8, seed=5)
+    for frame in range(200):
+        if rng.random() < 0.5:
+            ps.spawn_particle(rng.randint(0, 6))
+        if rng.random() < 0.5:
+            ps.add(make_particle((frame, frame), velocity=(1, 0), 
+                lifespan=rng.choice([0.1, 0.25, -1])))
+        ps.update(1)
+        check_slots(ps)
+        for p in ps:
+            if isinstance(p, Particle) and p._system is ps:
+                assert p.position == pygame.Vector2(ps.pos[p._index].tolist())
+
+def test_dead_particle_is_unbound():
+    ps = ParticleSystem()
+    p = make_particle(velocity=(1, 0), lifespan=2.5/60)
+    q = make_particle(velocity=(0, 1), lifespan=-1)
+    ps.add(p, q)
+    for _ in range(3):
+        ps.update(1)
+    assert p._system is None and p not in ps and ps.n == 1
+    assert p.lifespan == 0 and p.position == pygame.Vector2(3, 0)
+    assert q._index == 0 and q.position == pygame.Vector2(0, 3)